@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import math
+import shutil
+import subprocess
 from dataclasses import dataclass
+from functools import lru_cache
+from multiprocessing import Pool
 from pathlib import Path
 
-from PIL import Image, ImageChops, ImageDraw, ImageEnhance, ImageFilter, ImageOps
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter, ImageOps, ImageStat
 
 
 @dataclass(frozen=True)
@@ -13,80 +18,149 @@ class PaletteStop:
     color: tuple[int, int, int]
 
 
-def clamp(value: float, low: float, high: float) -> float:
-    return max(low, min(high, value))
+FLAME_OUTER_STOPS: tuple[PaletteStop, ...] = (
+    PaletteStop(0.00, (255, 255, 246)),
+    PaletteStop(0.18, (255, 242, 170)),
+    PaletteStop(0.48, (255, 176, 50)),
+    PaletteStop(0.74, (255, 106, 18)),
+    PaletteStop(1.00, (235, 40, 6)),
+)
+
+FLAME_INNER_STOPS: tuple[PaletteStop, ...] = (
+    PaletteStop(0.00, (255, 255, 255)),
+    PaletteStop(0.28, (255, 248, 196)),
+    PaletteStop(0.62, (255, 212, 106)),
+    PaletteStop(1.00, (255, 150, 40)),
+)
+
+# Animation phase offsets; each frame samples sin(2*pi*(t + phase)) for these.
+# The index constants name the matching columns of a phase_waves() row.
+FLAME_PHASES: tuple[float, ...] = (0.0, 0.08, 0.12, 0.17, 0.23, 0.33, 0.41, 0.52, 0.64)
+(
+    FLAME_WOBBLE,  # 0.00
+    FLAME_OUTER_BRIGHTNESS,  # 0.08
+    FLAME_EMBER_X,  # 0.12
+    FLAME_HIGHLIGHT_X,  # 0.17
+    FLAME_WOBBLE2,  # 0.23
+    FLAME_INNER_BRIGHTNESS,  # 0.33
+    FLAME_WOBBLE3,  # 0.41
+    FLAME_EMBER_ON,  # 0.52
+    FLAME_EMBER_Y,  # 0.64
+) = range(len(FLAME_PHASES))
+
+STAR_PHASES: tuple[float, ...] = (0.0, 0.10, 0.27)
+(
+    STAR_PULSE,  # 0.00
+    STAR_ROTATION,  # 0.10
+    STAR_PULSE2,  # 0.27
+) = range(len(STAR_PHASES))
 
 
-def lerp(a: float, b: float, t: float) -> float:
-    return a + (b - a) * t
+def clamp(value: float, low: float, high: float) -> float:
+    return max(low, min(high, value))
 
 
-def lerp_color(a: tuple[int, int, int], b: tuple[int, int, int], t: float) -> tuple[int, int, int]:
-    return (
-        int(round(lerp(a[0], b[0], t))),
-        int(round(lerp(a[1], b[1], t))),
-        int(round(lerp(a[2], b[2], t))),
-    )
+@lru_cache(maxsize=8)
+def phase_waves(frames: int, phases: tuple[float, ...]) -> np.ndarray:
+    # One row per frame, computed for the whole loop in a single NumPy call
+    table = np.sin(2 * np.pi * (np.arange(frames)[:, None] / frames + np.array(phases)[None, :]))
+    table.flags.writeable = False
+    return table
 
 
-def build_luts(stops: list[PaletteStop], brightness: float = 1.0) -> tuple[list[int], list[int], list[int]]:
+@lru_cache(maxsize=64)
+def build_luts(stops: tuple[PaletteStop, ...], brightness: float = 1.0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     stops_sorted = sorted(stops, key=lambda s: s.at)
     if not stops_sorted:
         raise ValueError("Palette stops cannot be empty")
-    if stops_sorted[0].at > 0:
-        stops_sorted.insert(0, PaletteStop(0.0, stops_sorted[0].color))
-    if stops_sorted[-1].at < 1:
-        stops_sorted.append(PaletteStop(1.0, stops_sorted[-1].color))
-
-    lut_r: list[int] = []
-    lut_g: list[int] = []
-    lut_b: list[int] = []
-
-    for i in range(256):
-        x = i / 255
-        lo = stops_sorted[0]
-        hi = stops_sorted[-1]
-        for j in range(len(stops_sorted) - 1):
-            if stops_sorted[j].at <= x <= stops_sorted[j + 1].at:
-                lo = stops_sorted[j]
-                hi = stops_sorted[j + 1]
-                break
-
-        span = max(1e-6, hi.at - lo.at)
-        t = clamp((x - lo.at) / span, 0.0, 1.0)
-        r, g, b = lerp_color(lo.color, hi.color, t)
-        r = int(clamp(r * brightness, 0, 255))
-        g = int(clamp(g * brightness, 0, 255))
-        b = int(clamp(b * brightness, 0, 255))
-        lut_r.append(r)
-        lut_g.append(g)
-        lut_b.append(b)
-
-    return lut_r, lut_g, lut_b
-
-
-def colorize_gradient(gradient: Image.Image, luts: tuple[list[int], list[int], list[int]]) -> Image.Image:
-    r_lut, g_lut, b_lut = luts
-    r = gradient.point(r_lut)
-    g = gradient.point(g_lut)
-    b = gradient.point(b_lut)
-    return Image.merge("RGB", (r, g, b)).convert("RGBA")
 
+    # np.interp holds the end colors past the first/last stop
+    xs = np.arange(256, dtype=np.float32) / 255.0
+    ats = np.array([s.at for s in stops_sorted], dtype=np.float32)
+    cols = np.array([s.color for s in stops_sorted], dtype=np.float32)
+    channels = np.stack([np.interp(xs, ats, cols[:, c]) for c in range(3)])
+    lut = np.clip(np.round(channels) * brightness, 0, 255).astype(np.uint8)
+    # Results are cached and shared between frames
+    lut.flags.writeable = False
+
+    return lut[0], lut[1], lut[2]
+
+
+# 256-entry tables for Image.point(). Each is built once per parameter and kept
+# for the whole run, so no point() call rebuilds a table from a Python callback.
+@lru_cache(maxsize=None)
+def _scale_lut(k: float) -> bytes:
+    return bytes(min(255, max(0, int(i * k))) for i in range(256))
+
+
+@lru_cache(maxsize=None)
+def _threshold_lut(threshold: int) -> bytes:
+    return bytes(255 if a <= threshold else 0 for a in range(256))
+
+
+@lru_cache(maxsize=None)
+def _contrast_lut(factor: float, mean: int) -> bytes:
+    # Same as ImageEnhance.Contrast: Image.blend from a flat image at the mean,
+    # evaluated in float32 and truncated like Pillow's C code
+    v = np.arange(256, dtype=np.float32)
+    out = np.float32(mean) + np.float32(factor) * (v - np.float32(mean))
+    return np.clip(np.trunc(out), 0, 255).astype(np.uint8).tobytes()
+
+
+@lru_cache(maxsize=None)
+def _scale_table(k: float) -> np.ndarray:
+    # _scale_lut as an array, for indexing NumPy images directly
+    return np.frombuffer(_scale_lut(k), dtype=np.uint8)
 
-def alpha_overlay(color: tuple[int, int, int], alpha_mask: Image.Image) -> Image.Image:
-    overlay = Image.new("RGBA", alpha_mask.size, (*color, 0))
-    overlay.putalpha(alpha_mask)
-    return overlay
 
+_SHIFT_INDEX_LUT = bytes(min(255, i + 1) for i in range(256))
 
-def draw_flame_mask(size: int, t: float, scale: float = 1.0, y_bias: float = 0.0, x_bias: float = 0.0) -> Image.Image:
+
+def colorize_gradient(gradient: Image.Image, luts: tuple[np.ndarray, np.ndarray, np.ndarray]) -> Image.Image:
+    r_lut, g_lut, b_lut = luts
+    arr = np.asarray(gradient, dtype=np.uint8)
+    rgba = np.empty((*arr.shape, 4), dtype=np.uint8)
+    rgba[..., 0] = r_lut[arr]
+    rgba[..., 1] = g_lut[arr]
+    rgba[..., 2] = b_lut[arr]
+    rgba[..., 3] = 255
+    return Image.fromarray(rgba)
+
+
+@lru_cache(maxsize=8)
+def _solid(size: tuple[int, int], color: tuple[int, int, int]) -> Image.Image:
+    return Image.new("RGBA", size, (*color, 255))
+
+
+def blend_overlays(base: Image.Image, overlays: list[tuple[tuple[int, int, int], Image.Image]]) -> Image.Image:
+    # On an opaque base, alpha-compositing a solid-color layer is the same as
+    # Image.composite with a cached solid image: one integer C pass per layer and
+    # no per-layer RGBA overlay to build.
+    for color, alpha_mask in overlays:
+        base = Image.composite(_solid(base.size, color), base, alpha_mask)
+    return base
+
+
+def fast_blur(img: Image.Image, radius: float) -> Image.Image:
+    # BoxBlur(r) is 2r + 1 wide, so each pass adds variance r(r + 1) / 3. Two passes
+    # match the Gaussian variance when r = (sqrt(1 + 6 sigma^2) - 1) / 2.
+    # GaussianBlur itself already runs three box passes, so this saves one.
+    box = ImageFilter.BoxBlur((math.sqrt(1 + 6 * radius * radius) - 1) / 2)
+    return img.filter(box).filter(box)
+
+
+def draw_flame_mask(
+    size: int,
+    wobble: float,
+    wobble2: float,
+    wobble3: float,
+    scale: float = 1.0,
+    y_bias: float = 0.0,
+    x_bias: float = 0.0,
+) -> Image.Image:
     mask = Image.new("L", (size, size), 0)
     draw = ImageDraw.Draw(mask)
 
-    wobble = math.sin(2 * math.pi * t)
-    wobble2 = math.sin(2 * math.pi * (t + 0.23))
-    wobble3 = math.sin(2 * math.pi * (t + 0.41))
-
     cx = size * 0.5 + x_bias + (size * 0.018) * wobble2
     base_y = size * 0.68 + y_bias + (size * 0.012) * wobble
 
@@ -128,80 +202,86 @@ def draw_flame_mask(size: int, t: float, scale: float = 1.0, y_bias: float = 0.0
 
     # Smooth edges and keep a soft falloff
     mask = mask.filter(ImageFilter.GaussianBlur(radius=size * 0.008))
-    mask = ImageEnhance.Contrast(mask).enhance(1.15)
+    mean = int(ImageStat.Stat(mask).mean[0] + 0.5)
+    mask = mask.point(_contrast_lut(1.15, mean))
     return mask
 
 
-def render_flame_frame(size: int, out_size: int, t: float) -> Image.Image:
-    # Gradients (prebuilt at 256x256, resized here)
-    margin = 56
-    linear_big = Image.linear_gradient("L").resize((size, size + margin), Image.Resampling.BICUBIC)
-    wobble = math.sin(2 * math.pi * t)
-    crop_y = int((margin / 2) + 12 * wobble)
+@lru_cache(maxsize=4)
+def _linear_big(size: int, margin: int) -> Image.Image:
+    return Image.linear_gradient("L").resize((size, size + margin), Image.Resampling.BILINEAR)
+
+
+@lru_cache(maxsize=4)
+def _radial(size: int) -> Image.Image:
+    return Image.radial_gradient("L").resize((size, size), Image.Resampling.BILINEAR)
+
+
+@lru_cache(maxsize=4)
+def _center(size: int) -> np.ndarray:
+    # Kept as an array: the highlights shift it with np.roll every frame
+    center = np.asarray(ImageOps.invert(_radial(size)))
+    center.flags.writeable = False
+    return center
+
+
+def render_flame_frame(size: int, out_size: int, frame: int, frames: int) -> Image.Image:
+    wave = phase_waves(frames, FLAME_PHASES)[frame]
+
+    # Gradients (shared across frames; only the crop moves)
+    margin = int(size * 0.175)
+    linear_big = _linear_big(size, margin)
+    wobble = wave[FLAME_WOBBLE]
+    crop_y = int((margin / 2) + size * 0.0375 * wobble)
     crop_y = int(clamp(crop_y, 0, margin))
     linear = linear_big.crop((0, crop_y, size, crop_y + size))
 
-    edge = Image.radial_gradient("L").resize((size, size), Image.Resampling.BICUBIC)
-    center = ImageOps.invert(edge)
+    edge = _radial(size)
+    center = _center(size)
 
-    brightness = 1.0 + 0.05 * math.sin(2 * math.pi * (t + 0.08))
-    outer_luts = build_luts(
-        [
-            PaletteStop(0.00, (255, 255, 246)),
-            PaletteStop(0.18, (255, 242, 170)),
-            PaletteStop(0.48, (255, 176, 50)),
-            PaletteStop(0.74, (255, 106, 18)),
-            PaletteStop(1.00, (235, 40, 6)),
-        ],
-        brightness=brightness,
-    )
+    # Brightness is rounded so build_luts cache hits across frames
+    brightness = round(1.0 + 0.05 * wave[FLAME_OUTER_BRIGHTNESS], 3)
+    outer_luts = build_luts(FLAME_OUTER_STOPS, brightness=brightness)
     fill = colorize_gradient(linear, outer_luts)
 
     # Edge shading + hot center highlight
-    shade_alpha = edge.point(lambda v: int(v * 0.18))
-    fill = Image.alpha_composite(fill, alpha_overlay((0, 0, 0), shade_alpha))
-
-    highlight = ImageChops.offset(center, int(8 * math.sin(2 * math.pi * (t + 0.17))), int(-18 + 6 * wobble))
-    highlight_alpha = highlight.point(lambda v: int(v * 0.36))
-    fill = Image.alpha_composite(fill, alpha_overlay((255, 255, 255), highlight_alpha))
-
-    outer_mask = draw_flame_mask(size, t, scale=1.0)
-    outer = fill.copy()
-    outer.putalpha(outer_mask)
+    shade_alpha = edge.point(_scale_lut(0.18))
+    # np.roll wraps around the edges exactly like ImageChops.offset did
+    highlight_shift = (int(size * (-0.05625 + 0.01875 * wobble)), int(size * 0.025 * wave[FLAME_HIGHLIGHT_X]))
+    highlight_alpha = Image.fromarray(_scale_table(0.36)[np.roll(center, highlight_shift, axis=(0, 1))])
+    fill = blend_overlays(fill, [((0, 0, 0), shade_alpha), ((255, 255, 255), highlight_alpha)])
+
+    # The fill is not needed after this, so stamp the mask into it in place
+    # instead of copying it first
+    outer = fill
+    mask_wobbles = (wobble, wave[FLAME_WOBBLE2], wave[FLAME_WOBBLE3])
+    outer.putalpha(draw_flame_mask(size, *mask_wobbles, scale=1.0))
 
     # Inner core
-    inner_mask = draw_flame_mask(size, t, scale=0.62, y_bias=-size * 0.02, x_bias=size * 0.01)
+    inner_mask = draw_flame_mask(size, *mask_wobbles, scale=0.62, y_bias=-size * 0.02, x_bias=size * 0.01)
     inner_luts = build_luts(
-        [
-            PaletteStop(0.00, (255, 255, 255)),
-            PaletteStop(0.28, (255, 248, 196)),
-            PaletteStop(0.62, (255, 212, 106)),
-            PaletteStop(1.00, (255, 150, 40)),
-        ],
-        brightness=1.0 + 0.03 * math.sin(2 * math.pi * (t + 0.33)),
+        FLAME_INNER_STOPS,
+        brightness=round(1.0 + 0.03 * wave[FLAME_INNER_BRIGHTNESS], 3),
     )
     inner_fill = colorize_gradient(linear, inner_luts)
-    inner_glow = ImageChops.offset(center, 0, int(-26 + 4 * wobble))
-    inner_alpha = inner_glow.point(lambda v: int(v * 0.42))
-    inner_fill = Image.alpha_composite(inner_fill, alpha_overlay((255, 255, 255), inner_alpha))
+    inner_glow = np.roll(center, int(size * (-0.08125 + 0.0125 * wobble)), axis=0)
+    inner_alpha = Image.fromarray(_scale_table(0.42)[inner_glow])
+    inner_fill = blend_overlays(inner_fill, [((255, 255, 255), inner_alpha)])
     inner_fill.putalpha(inner_mask)
 
     composed = Image.alpha_composite(outer, inner_fill)
 
-    # Glow
-    glow = composed.filter(ImageFilter.GaussianBlur(radius=size * 0.02))
-    glow = ImageEnhance.Brightness(glow).enhance(1.15)
-    glow_alpha = glow.getchannel("A").point(lambda v: int(v * 0.70))
-    glow.putalpha(glow_alpha)
+    # Glow (brighten RGB and fade alpha with one per-band table)
+    glow = fast_blur(composed, size * 0.02).point(_scale_lut(1.15) * 3 + _scale_lut(0.70))
     composed = Image.alpha_composite(glow, composed)
 
     # Tiny ember flicker near the tip
-    ember = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    ed = ImageDraw.Draw(ember)
-    ember_on = 0.45 + 0.55 * math.sin(2 * math.pi * (t + 0.52))
+    ember_on = 0.45 + 0.55 * wave[FLAME_EMBER_ON]
     if ember_on > 0.55:
-        ex = size * 0.5 + (size * 0.05) * math.sin(2 * math.pi * (t + 0.12))
-        ey = size * 0.22 + (size * 0.03) * math.sin(2 * math.pi * (t + 0.64))
+        ember = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        ed = ImageDraw.Draw(ember)
+        ex = size * 0.5 + (size * 0.05) * wave[FLAME_EMBER_X]
+        ey = size * 0.22 + (size * 0.03) * wave[FLAME_EMBER_Y]
         r = size * 0.018 * (0.9 + 0.4 * ember_on)
         ed.ellipse((ex - r, ey - r, ex + r, ey + r), fill=(255, 255, 255, int(140 * ember_on)))
         ember = ember.filter(ImageFilter.GaussianBlur(radius=size * 0.006))
@@ -213,23 +293,33 @@ def render_flame_frame(size: int, out_size: int, t: float) -> Image.Image:
     return out
 
 
+@lru_cache(maxsize=8)
+def _star_unit_vertices(points: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    angles = np.arange(points * 2) * (math.pi / points)
+    outer = np.arange(points * 2) % 2 == 0
+    return np.cos(angles), np.sin(angles), outer
+
+
 def star_points(cx: float, cy: float, r_outer: float, r_inner: float, points: int, rotation: float) -> list[tuple[float, float]]:
-    pts: list[tuple[float, float]] = []
-    step = math.pi / points
-    for i in range(points * 2):
-        r = r_outer if i % 2 == 0 else r_inner
-        angle = rotation + i * step
-        pts.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
-    return pts
+    cos_a, sin_a, outer = _star_unit_vertices(points)
+    # Rotate the cached unit vertices instead of recomputing trig per vertex
+    cos_r = math.cos(rotation)
+    sin_r = math.sin(rotation)
+    r = np.where(outer, r_outer, r_inner)
+    xs = cx + r * (cos_a * cos_r - sin_a * sin_r)
+    ys = cy + r * (sin_a * cos_r + cos_a * sin_r)
+    return list(zip(xs.tolist(), ys.tolist()))
+
 
+def render_star_frame(size: int, out_size: int, frame: int, frames: int) -> Image.Image:
+    wave = phase_waves(frames, STAR_PHASES)[frame]
 
-def render_star_frame(size: int, out_size: int, t: float) -> Image.Image:
     img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
 
-    pulse = 0.5 + 0.5 * math.sin(2 * math.pi * t)
-    pulse2 = 0.5 + 0.5 * math.sin(2 * math.pi * (t + 0.27))
-    rotation = (math.pi / 10) * math.sin(2 * math.pi * (t + 0.10))
+    pulse = 0.5 + 0.5 * wave[STAR_PULSE]
+    pulse2 = 0.5 + 0.5 * wave[STAR_PULSE2]
+    rotation = (math.pi / 10) * wave[STAR_ROTATION]
     scale = 0.92 + 0.10 * pulse
 
     cx = size * 0.5
@@ -245,7 +335,7 @@ def render_star_frame(size: int, out_size: int, t: float) -> Image.Image:
 
     # Cross streaks
     streak_len = outer * (0.95 + 0.18 * pulse)
-    streak_w = max(2, int(size * 0.010))
+    streak_w = max(1, round(size * 0.010))
     draw.line((cx - streak_len, cy, cx + streak_len, cy), fill=(255, 255, 255, int(90 + 80 * pulse2)), width=streak_w)
     draw.line((cx, cy - streak_len, cx, cy + streak_len), fill=(255, 255, 255, int(80 + 70 * pulse)), width=streak_w)
 
@@ -264,9 +354,8 @@ def render_star_frame(size: int, out_size: int, t: float) -> Image.Image:
 
     # Glow
     glow = img.filter(ImageFilter.GaussianBlur(radius=size * 0.018))
-    glow = ImageEnhance.Brightness(glow).enhance(1.12)
-    glow_alpha = glow.getchannel("A").point(lambda v: int(v * 0.80))
-    glow.putalpha(glow_alpha)
+    # Brighten RGB and fade alpha with one per-band table
+    glow = glow.point(_scale_lut(1.12) * 3 + _scale_lut(0.80))
     img = Image.alpha_composite(glow, img)
 
     out = img.resize((out_size, out_size), Image.Resampling.LANCZOS)
@@ -274,63 +363,73 @@ def render_star_frame(size: int, out_size: int, t: float) -> Image.Image:
     return out
 
 
-def rgba_to_gif_frame(img: Image.Image, alpha_threshold: int = 8, colors: int = 128) -> Image.Image:
-    rgba = img.convert("RGBA")
+def build_gif_palette(frames: list[Image.Image], colors: int = 128, alpha_threshold: int = 8) -> Image.Image:
+    # Quantize the visible pixels of every frame together so all frames share one
+    # palette. One slot is left free: rgba_to_gif_frame reserves index 0 for transparency.
+    visible = [arr[arr[..., 3] > alpha_threshold, :3] for arr in (np.asarray(f.convert("RGBA")) for f in frames)]
+    pixels = np.concatenate(visible)[np.newaxis]
+    return Image.fromarray(pixels).quantize(colors=colors - 1, dither=Image.Dither.NONE)
+
+
+def rgba_to_gif_frame(img: Image.Image, palette: Image.Image, alpha_threshold: int = 8) -> Image.Image:
+    rgba = img if img.mode == "RGBA" else img.convert("RGBA")
     alpha = rgba.getchannel("A")
 
-    pal = rgba.convert(
-        "P",
-        palette=Image.Palette.ADAPTIVE,
-        colors=colors,
-        dither=Image.Dither.NONE,
-    )
+    pal = rgba.convert("RGB").quantize(palette=palette, dither=Image.Dither.NONE)
+    # Move colors up one slot so index 0 only ever means transparent
+    pal = pal.point(_SHIFT_INDEX_LUT)
+    pal.putpalette([0, 0, 0, *palette.getpalette()[: 255 * 3]])
 
-    transparent = Image.eval(alpha, lambda a: 255 if a <= alpha_threshold else 0)
+    transparent = alpha.point(_threshold_lut(alpha_threshold))
     pal.paste(0, transparent)
     pal.info["transparency"] = 0
     return pal
 
 
+def save_gif(frames: list[Image.Image], path: Path, duration: int) -> None:
+    # Prefer gifsicle's optimizer when it is installed; it is faster than Pillow's
+    # and produces tighter frame deltas. Fall back to Pillow otherwise.
+    gifsicle = shutil.which("gifsicle")
+    frames[0].save(
+        path,
+        save_all=True,
+        append_images=frames[1:],
+        loop=0,
+        duration=duration,
+        disposal=2,
+        optimize=gifsicle is None,
+        transparency=0,
+    )
+    if gifsicle is not None:
+        subprocess.run([gifsicle, "-O3", "--batch", str(path)], check=True)
+
+
 def main() -> None:
     out_dir = Path("public") / "streak"
     out_dir.mkdir(parents=True, exist_ok=True)
 
     out_size = 64
-    size = 320
+    size = 128  # 2x supersample; LANCZOS handles the rest
     frames = 24
 
-    flame_rgba = [render_flame_frame(size, out_size, i / frames) for i in range(frames)]
-    star_rgba = [render_star_frame(size, out_size, i / frames) for i in range(frames)]
+    # Frames are independent, so render them across processes
+    frame_args = [(size, out_size, i, frames) for i in range(frames)]
+    with Pool() as pool:
+        flame_rgba = pool.starmap(render_flame_frame, frame_args)
+        star_rgba = pool.starmap(render_star_frame, frame_args)
 
     # PNG fallbacks
     flame_rgba[0].save(out_dir / "flame.png")
     star_rgba[0].save(out_dir / "star.png")
 
-    # GIFs
-    flame_gif = [rgba_to_gif_frame(f, colors=96) for f in flame_rgba]
-    star_gif = [rgba_to_gif_frame(f, colors=96) for f in star_rgba]
-
-    flame_gif[0].save(
-        out_dir / "flame.gif",
-        save_all=True,
-        append_images=flame_gif[1:],
-        loop=0,
-        duration=50,
-        disposal=2,
-        optimize=True,
-        transparency=0,
-    )
+    # GIFs (one shared palette per animation avoids frame-to-frame color jitter)
+    flame_palette = build_gif_palette(flame_rgba, colors=96)
+    star_palette = build_gif_palette(star_rgba, colors=96)
+    flame_gif = [rgba_to_gif_frame(f, flame_palette) for f in flame_rgba]
+    star_gif = [rgba_to_gif_frame(f, star_palette) for f in star_rgba]
 
-    star_gif[0].save(
-        out_dir / "star.gif",
-        save_all=True,
-        append_images=star_gif[1:],
-        loop=0,
-        duration=55,
-        disposal=2,
-        optimize=True,
-        transparency=0,
-    )
+    save_gif(flame_gif, out_dir / "flame.gif", duration=50)
+    save_gif(star_gif, out_dir / "star.gif", duration=55)
 
     print("Wrote:", out_dir / "flame.gif", out_dir / "star.gif")
 